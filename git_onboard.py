@@ -4,9 +4,16 @@ Git Onboard — A Git learning companion.
 Teaches Git by walking you through real commands with plain-English explanations.
 """
 
+import atexit
+import codecs
+import ntpath
+import re
 import subprocess
 import sys
 import os
+import threading
+import time
+from collections import namedtuple
 
 
 # ============================================================
@@ -14,52 +21,212 @@ import os
 # These are the building blocks every workflow uses.
 # ============================================================
 
+# ANSI escape codes for "clear the screen", "clear the scrollback" (like
+# 'cls' and 'clear' do) and "move the cursor to the top-left corner".
+# Writing these is instant; running 'cls'/'clear' starts a whole new shell
+# every time.
+_CLEAR = "\x1b[2J\x1b[3J\x1b[H"
+_ansi_ready = None  # worked out on the first clear_screen()
+
+
+def _enable_ansi():
+    """
+    Make sure the terminal understands ANSI escape codes.
+    Returns False if it can't (or we can't tell).
+    """
+    if not sys.stdout.isatty():
+        # Output is going somewhere that isn't a terminal (a file, a pipe,
+        # an IDE panel)
+        return False
+    if os.name != "nt":
+        return True
+    # Windows 10+ consoles understand them once "virtual terminal
+    # processing" is switched on for our output handle
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        # 0x0004 = ENABLE_VIRTUAL_TERMINAL_PROCESSING
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+    except (ImportError, AttributeError, OSError):
+        return False
+
+
 def clear_screen():
     """Clear the terminal for a fresh view."""
-    os.system("cls" if os.name == "nt" else "clear")
+    global _ansi_ready
+    if _ansi_ready is None:
+        _ansi_ready = _enable_ansi()
+    if not _ansi_ready:
+        # Leave it to the system command
+        os.system("cls" if os.name == "nt" else "clear")
+        return
+    sys.stdout.write(_CLEAR)
+    sys.stdout.flush()
 
 
 def explain(text):
     """Print an explanation block — visually distinct from commands and output."""
-    print()
-    for line in text.strip().splitlines():
-        print(f"  {line}")
-    print()
+    # Build the whole block first and write it once, instead of one
+    # print() (and one terminal write) per line
+    body = "".join(f"  {line}\n" if line else "\n"
+                   for line in text.strip().splitlines())
+    sys.stdout.write(f"\n{body}\n")
 
 
 SEPARATOR = "  ────────────────────────────────────────────────────────────"
 
 
-def run_git(*args):
+class GitCache:
+    """
+    Remembers the answers to read-only Git questions (where's the repo,
+    which branch am I on, what's my remote) so we don't spawn Git again
+    every time a menu option runs.
+
+    Each answer is tied to a few files inside .git (like HEAD or index).
+    If any of those files change, or the answer gets older than `ttl`
+    seconds, we ask Git again.
+    """
+
+    def __init__(self, ttl=30.0):
+        self.ttl = ttl
+        self._entries = {}
+
+    @staticmethod
+    def _stamp(paths):
+        """Modification times for each path (None if it doesn't exist)."""
+        stamp = []
+        for p in paths:
+            try:
+                stamp.append(os.stat(p).st_mtime_ns)
+            except OSError:
+                stamp.append(None)
+        return tuple(stamp)
+
+    def get(self, key, producer, mtime_paths=(), ttl=None):
+        """
+        Return the cached answer for `key`, or call producer() to get it.
+        mtime_paths can also be a function that takes the answer and
+        returns the paths to watch, for when the answer itself says
+        where to look. ttl overrides the cache-wide TTL for this key.
+        """
+        cache_key = (os.getcwd(), key)
+        if ttl is None:
+            ttl = self.ttl
+        now = time.monotonic()
+
+        def stamp_for(value):
+            paths = mtime_paths(value) if callable(mtime_paths) else mtime_paths
+            return self._stamp(paths)
+
+        entry = self._entries.get(cache_key)
+        if entry is not None:
+            value, old_stamp, created = entry
+            if now - created < ttl and stamp_for(value) == old_stamp:
+                return value
+
+        value = producer()
+        self._entries[cache_key] = (value, stamp_for(value), now)
+        return value
+
+    def invalidate(self, *keys):
+        """Forget the given answers (or everything, if no keys are given)."""
+        if not keys:
+            self._entries.clear()
+            return
+        for cache_key in list(self._entries):
+            if cache_key[1] in keys:
+                del self._entries[cache_key]
+
+
+_git_cache = GitCache()
+
+# Commands that change the repo. After running one of these through
+# run_git(), every cached answer might be out of date.
+_MUTATING_COMMANDS = {"init", "add", "commit", "rm", "mv", "remote",
+                      "checkout", "merge", "branch", "push", "clone"}
+
+
+# Windows line-ending noise that would confuse beginners. It's harmless and
+# not actionable. core.safecrlf=false tells Git not to print it at all (line
+# endings are still converted exactly as before); the pattern catches any
+# whole warning line that slips through anyway.
+_QUIET_CRLF = ["-c", "core.safecrlf=false"]
+_CRLF_NEEDLE = b"LF will be replaced by CRLF"
+_CRLF_LINE = re.compile(rb"^.*LF will be replaced by CRLF.*(?:\r?\n|$)", re.M)
+
+# Commands we mostly use to look at the repo. For these,
+# --no-optional-locks stops Git from grabbing .git/index.lock just to
+# refresh its cache, so we never stall behind (or block) an editor's Git
+# integration. 'branch' and 'remote' can also change things ('branch -d',
+# 'remote add'), which is why they're in _MUTATING_COMMANDS too. The
+# option only skips *optional* locks, so those changes still lock what
+# they need.
+_READ_ONLY_COMMANDS = {"status", "branch", "remote", "log", "rev-parse",
+                       "diff", "show"}
+
+
+def _git_command(args):
+    """
+    The full command line to run for `args`, including the options we add
+    behind the scenes (the user only ever sees 'git' + args).
+    """
+    cmd = ["git"] + _QUIET_CRLF
+    if args and args[0] in _READ_ONLY_COMMANDS:
+        cmd.append("--no-optional-locks")
+    if args and args[0] == "status":
+        # Skip comparing against the remote — we never show ahead/behind
+        return cmd + ["status", "--no-ahead-behind"] + args[1:]
+    return cmd + args
+
+
+# The frame around every Git command's output, each written in one go
+_COMMAND_HEADER = (
+    "\n"
+    "  COMMAND RAN: {cmd}\n"
+    "{folder}"
+    "\n"
+    "  Below is the output you'd see if you typed '{cmd}'\n"
+    "  directly in your terminal. This is what Git is telling you:\n"
+    + SEPARATOR + "\n"
+)
+_COMMAND_FOOTER = SEPARATOR + "\n\n"
+
+
+def show_command_header(args, cwd=None):
+    """Print the 'COMMAND RAN' banner that comes before a Git command's output."""
+    folder = f"  IN FOLDER:   {cwd}\n" if cwd else ""
+    sys.stdout.write(_COMMAND_HEADER.format(
+        cmd=" ".join(["git"] + list(args)), folder=folder
+    ))
+
+
+def run_git(*args, cwd=None):
     """
     Run a Git command via subprocess.
     Shows the actual command, a bridge explanation, the raw output
     inside visual separators, and returns the result.
+    Pass cwd to run the command in another folder without leaving this one.
     Returns (success: bool, stdout: str, stderr: str).
     """
-    cmd = ["git"] + list(args)
-    cmd_str = " ".join(cmd)
-
-    print()
-    print(f"  COMMAND RAN: {cmd_str}")
-    print()
-    print(f"  Below is the output you'd see if you typed '{cmd_str}'")
-    print("  directly in your terminal. This is what Git is telling you:")
-    print(SEPARATOR)
+    show_command_header(args, cwd)
 
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    # The extra options go to Git but aren't shown — the user should see
+    # the command they'd actually type
+    result = subprocess.run(_git_command(list(args)), capture_output=True, cwd=cwd)
 
-    output = result.stdout.strip()
-    error = result.stderr.strip()
+    # Work on the raw bytes and decode once at the end. Git writes UTF-8,
+    # so decode it as UTF-8 rather than whatever the console's code page is.
+    stderr = result.stderr
+    if _CRLF_NEEDLE in stderr:
+        # Only run the pattern if there's a CRLF warning to remove
+        stderr = _CRLF_LINE.sub(b"", stderr)
 
-    # Filter out CRLF warnings — these are just Windows line-ending noise
-    # that would confuse beginners. They're harmless and not actionable.
-    if error:
-        filtered_lines = [
-            line for line in error.splitlines()
-            if "LF will be replaced by CRLF" not in line
-        ]
-        error = "\n".join(filtered_lines).strip()
+    output = result.stdout.decode("utf-8", errors="replace").strip()
+    error = stderr.decode("utf-8", errors="replace").strip()
 
     if output:
         print(output)
@@ -72,11 +239,95 @@ def run_git(*args):
     if not output and not error:
         print("  (no output)")
 
-    print(SEPARATOR)
-    print()
+    sys.stdout.write(_COMMAND_FOOTER)
+
+    if args and args[0] in _MUTATING_COMMANDS:
+        _git_cache.invalidate()
+
     return result.returncode == 0, output, error
 
 
+def _pump(pipe, chunks, shown):
+    """
+    Copy a pipe to the screen as data arrives, keeping a copy in `chunks`.
+    `shown` is shared by both pipes and records everything that hit the
+    screen, in order.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    for data in iter(lambda: pipe.read1(8192), b""):
+        text = decoder.decode(data)
+        chunks.append(text)
+        shown.append(text)
+        sys.stdout.write(text)
+        sys.stdout.flush()
+    chunks.append(decoder.decode(b"", final=True))
+
+
+# Commands that print progress counters, but only to a terminal unless
+# asked with --progress
+_PROGRESS_COMMANDS = {"push", "clone", "fetch", "pull"}
+
+
+def run_git_streaming(*args):
+    """
+    Like run_git(), but Git's output is shown as it happens instead of all
+    at once at the end. Use it for slow network commands (push, clone), so
+    you can watch the progress counters move, and for commands whose
+    output can be long (log), so nothing is held back in memory first.
+    Returns (success: bool, stdout: str, stderr: str).
+    """
+    show_command_header(args)
+
+    # Like the -c options in run_git(), --progress isn't shown to the user
+    args = list(args)
+    if args[0] in _PROGRESS_COMMANDS:
+        args.insert(1, "--progress")
+    cmd = _git_command(args)
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+
+    # One reader per pipe, so a full stderr can never block stdout (or
+    # vice versa). Threads rather than select(), which can't watch pipes
+    # on Windows.
+    out_chunks, err_chunks, shown = [], [], []
+    readers = [
+        threading.Thread(target=_pump, args=(proc.stdout, out_chunks, shown),
+                         daemon=True),
+        threading.Thread(target=_pump, args=(proc.stderr, err_chunks, shown),
+                         daemon=True),
+    ]
+    for reader in readers:
+        reader.start()
+    try:
+        returncode = proc.wait()
+    except KeyboardInterrupt:
+        # Ctrl+C: stop Git too, and wait for it to exit, rather than leave
+        # a push or clone running in the background after we've moved on
+        proc.terminate()
+        proc.wait()
+        raise
+    for reader in readers:
+        reader.join()
+
+    output = "".join(out_chunks).strip()
+    # Progress counters redraw themselves with '\r' — keep only the final
+    # state of each line for the copy we hand back
+    error = "\n".join(
+        line.rsplit("\r", 1)[-1] for line in "".join(err_chunks).split("\n")
+    ).strip()
+
+    if not output and not error:
+        print("  (no output)")
+    elif shown and not shown[-1].endswith("\n"):
+        print()
+
+    sys.stdout.write(_COMMAND_FOOTER)
+
+    if args[0] in _MUTATING_COMMANDS:
+        _git_cache.invalidate()
+
+    return returncode == 0, output, error
+
+
 def prompt_yes_no(question):
     """Ask a yes/no question. Returns True for yes."""
     while True:
@@ -88,19 +339,587 @@ def prompt_yes_no(question):
         print("  Please enter y or n.")
 
 
-def is_git_repo():
-    """Check if the current directory is inside a Git repository."""
+def prompt_choice(count, prompt="Pick an option"):
+    """
+    Ask the user to pick one of the numbered options 1..count.
+    Returns the number they picked.
+    """
+    # Compare against the valid answers directly — no int() that has to
+    # raise (and catch) an exception every time someone mistypes
+    valid = [str(n) for n in range(1, count + 1)]
+    if count == 1:
+        hint = "  Please enter 1."
+    else:
+        hint = f"  Please enter {', '.join(valid[:-1])}, or {valid[-1]}."
+    while True:
+        answer = input(f"  {prompt}: ").strip()
+        if answer in valid:
+            return int(answer)
+        print(hint)
+
+
+def split_paths(text):
+    """
+    Split a line of user input into file names, respecting quotes.
+    Raises ValueError if a quote is left open.
+    """
+    import shlex  # only needed here, so don't pay for it at startup
+
+    if os.name == "nt":
+        # Windows paths use backslashes, which POSIX-style splitting would
+        # treat as escape characters. Split Windows-style, then drop quotes.
+        return [p.strip('"') for p in shlex.split(text, posix=False)]
+    return shlex.split(text)
+
+
+# Everything a workflow needs to know about "where am I?" in one place.
+#   inside_tree: True if the current folder is inside a Git repo
+#   toplevel:    the repo's root folder (None outside a repo)
+#   git_dir:     the repo's .git folder (None outside a repo)
+GitContext = namedtuple("GitContext", ["inside_tree", "toplevel", "git_dir"])
+
+
+# If any of these are set, Git isn't finding the repo by looking for a
+# .git folder, so neither can we
+_GIT_LOCATION_VARS = ("GIT_DIR", "GIT_WORK_TREE", "GIT_CEILING_DIRECTORIES")
+
+
+def _find_git_context():
+    """
+    Find the repo the way Git does: look for a .git entry in this folder,
+    then its parent, and so on up to the top of the drive. Checking for a
+    file is far cheaper than starting 'git rev-parse'.
+    Returns a GitContext, or None if Git itself should be asked.
+    """
+    if any(var in os.environ for var in _GIT_LOCATION_VARS):
+        return None
+
+    folder = os.getcwd()
+    if ".git" in folder.split(os.sep):
+        return None  # somewhere inside a .git folder itself
+
+    while True:
+        dot_git = os.path.join(folder, ".git")
+        if os.path.isdir(dot_git):
+            if not os.path.isfile(os.path.join(dot_git, "HEAD")):
+                # An empty or stray .git folder isn't a repo. Git would
+                # skip it and keep looking, so let Git decide.
+                return None
+            return GitContext(True, folder, dot_git)
+        if os.path.isfile(dot_git):
+            # Worktrees and submodules have a .git *file* that says
+            # "gitdir: <where the real .git folder is>"
+            try:
+                with open(dot_git, encoding="utf-8") as f:
+                    pointer = f.read().strip()
+            except OSError:
+                return None
+            if not pointer.startswith("gitdir: "):
+                return None
+            git_dir = os.path.join(folder, pointer[len("gitdir: "):])
+            return GitContext(True, folder, os.path.abspath(git_dir))
+
+        parent = os.path.dirname(folder)
+        if parent == folder:
+            return GitContext(False, None, None)
+        folder = parent
+
+
+def _read_git_context():
+    context = _find_git_context()
+    if context is not None:
+        return context
+
+    # Background lookups like this one only read stdout. Sending stderr to
+    # DEVNULL means Git's complaints ("not a git repository") are dropped
+    # by the OS instead of being collected and decoded just to be ignored.
+    result = subprocess.run(
+        ["git", "--no-optional-locks", "rev-parse",
+         "--is-inside-work-tree", "--show-toplevel", "--git-dir"],
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+    )
+    lines = result.stdout.strip().splitlines()
+    if result.returncode != 0 or len(lines) < 3 or lines[0] != "true":
+        return GitContext(False, None, None)
+    return GitContext(True, lines[1], os.path.abspath(lines[2]))
+
+
+def get_git_context():
+    """
+    Work out where we are by looking for the .git folder, falling back to
+    a single 'git rev-parse' call for the unusual setups only Git can
+    answer, instead of spawning a separate process for each question.
+    Returns a GitContext.
+    """
+    # Every workflow asks this first, so it only costs a few stat() calls
+    # once known: a .git folder appearing or disappearing (here, or above
+    # us while we're outside a repo), or the repo's HEAD file vanishing,
+    # means the answer changed. 'init' and 'clone' through run_git() clear
+    # it too, so no TTL is needed.
+    return _git_cache.get("context", _read_git_context, _context_watch_paths,
+                          ttl=float("inf"))
+
+
+def _context_watch_paths(ctx):
+    if not ctx.inside_tree:
+        # A repo made in this folder or any folder above it (say, by
+        # 'git init' in another window) would put us inside it
+        paths = []
+        folder = os.getcwd()
+        while True:
+            paths.append(os.path.join(folder, ".git"))
+            parent = os.path.dirname(folder)
+            if parent == folder:
+                return paths
+            folder = parent
+    return [".git", os.path.join(ctx.git_dir, "HEAD")]
+
+
+def _git_dir_paths(*names):
+    """Paths to files inside the current repo's .git folder."""
+    git_dir = get_git_context().git_dir
+    if not git_dir:
+        return []
+    return [os.path.join(git_dir, name) for name in names]
+
+
+def _read_current_branch():
+    """
+    Read the branch name straight out of .git/HEAD — no Git process needed.
+    HEAD normally holds "ref: refs/heads/<branch>". When it holds a raw
+    commit hash instead, you're not on any branch ("detached HEAD").
+    """
+    head_paths = _git_dir_paths("HEAD")
+    if not head_paths:
+        return ""
+    try:
+        with open(head_paths[0], encoding="utf-8") as f:
+            head = f.read().strip()
+    except OSError:
+        head = ""
+
+    prefix = "ref: refs/heads/"
+    if head.startswith(prefix) and head != prefix + ".invalid":
+        return head[len(prefix):]
+    if head and not head.startswith("ref: "):
+        return ""  # detached HEAD
+
+    # Newer repo formats don't keep the branch in HEAD — ask Git instead
     result = subprocess.run(
-        ["git", "rev-parse", "--is-inside-work-tree"],
-        capture_output=True, text=True
+        ["git", "--no-optional-locks", "branch", "--show-current"],
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
     )
-    return result.returncode == 0
+    return result.stdout.strip()
+
+
+def get_current_branch():
+    """Name of the branch you're on ('' if you're not on a branch)."""
+    # Switching branches rewrites .git/HEAD
+    return _git_cache.get("branch", _read_current_branch, _git_dir_paths("HEAD"))
+
+
+def parse_branch_list(output):
+    """
+    Branch names from 'git branch' output. Each line starts with a
+    two-character marker ('* ' for the branch you're on, '+ ' for one
+    checked out in another worktree); a detached HEAD shows up as
+    '(HEAD detached at ...)', which isn't a branch you can merge.
+    """
+    branches = []
+    for line in output.splitlines():
+        name = line.strip()
+        if name.startswith(("* ", "+ ")):
+            name = name[2:]
+        if name and not name.startswith("("):
+            branches.append(name)
+    return branches
+
+
+def get_remotes():
+    """The output of 'git remote -v' ('' if no remote is set up)."""
+    def read():
+        result = subprocess.run(
+            ["git", "--no-optional-locks", "remote", "-v"],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+        )
+        return result.stdout.strip()
+    # Remotes are stored in .git/config
+    return _git_cache.get("remotes", read, _git_dir_paths("config"))
+
+
+class PersistentGit:
+    """
+    One long-running 'git cat-file --batch-check' process for a repo.
+    Looking something up (like "does HEAD point at a commit yet?") is a
+    line written to its input and a line read back, instead of starting
+    a whole new Git process for every question.
+    """
+
+    def __init__(self, git_dir):
+        self.git_dir = git_dir
+        self._proc = None
+
+    def _start(self):
+        # --git-dir instead of cwd, so we never hold the project folder open.
+        # We never use an object's size, so don't ask Git to look it up.
+        self._proc = subprocess.Popen(
+            ["git", "--git-dir", self.git_dir, "cat-file",
+             "--batch-check=%(objectname) %(objecttype)"],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL, text=True, bufsize=1
+        )
+
+    def query(self, name):
+        """
+        Look up an object name like 'HEAD' or 'main:README.md'.
+        Returns "<hash> <type>", or None if it doesn't exist.
+        """
+        # If the helper died for some reason, start a new one and retry once
+        for _ in range(2):
+            if self._proc is None or self._proc.poll() is not None:
+                self._start()
+            try:
+                self._proc.stdin.write(name + "\n")
+                self._proc.stdin.flush()
+                line = self._proc.stdout.readline().rstrip("\n")
+            except OSError:
+                line = ""
+            if line:
+                if line.endswith((" missing", " ambiguous")):
+                    return None
+                return line
+            self.close()
+        return None
+
+    def close(self):
+        """Shut the helper down (closing its input tells it to exit)."""
+        if self._proc is None:
+            return
+        try:
+            self._proc.stdin.close()
+        except OSError:
+            pass
+        self._proc.wait()
+        self._proc = None
+
+
+_persistent_git = None
+
+
+def get_persistent_git():
+    """The PersistentGit for the current repo, or None outside a repo."""
+    global _persistent_git
+    git_dir = get_git_context().git_dir
+    if not git_dir:
+        return None
+    if _persistent_git is None or _persistent_git.git_dir != git_dir:
+        # Moved to a different repo (e.g. after init) — start a fresh helper
+        _close_persistent_git()
+        _persistent_git = PersistentGit(git_dir)
+    return _persistent_git
+
+
+def _close_persistent_git():
+    if _persistent_git is not None:
+        _persistent_git.close()
+
+
+atexit.register(_close_persistent_git)
+
+
+def _has_commits_on_disk(git_dir):
+    """
+    Answer "does HEAD point at a commit yet?" by looking at files in .git.
+    Before the first commit, HEAD names a branch that doesn't exist yet —
+    neither as its own file under refs/heads nor as a line in packed-refs.
+    Returns None when the files can't tell us.
+    """
+    try:
+        with open(os.path.join(git_dir, "HEAD"), encoding="utf-8") as f:
+            head = f.read().strip()
+    except OSError:
+        return None
+    if not head.startswith("ref: "):
+        return bool(head)  # detached HEAD: a commit hash
+    ref = head[len("ref: "):]
+    if ref == "refs/heads/.invalid":
+        return None  # newer repo format that doesn't keep refs as files
+
+    # Extra worktrees keep their branches in the main repo's .git folder
+    common_dir = git_dir
+    try:
+        with open(os.path.join(git_dir, "commondir"), encoding="utf-8") as f:
+            common_dir = os.path.join(git_dir, f.read().strip())
+    except OSError:
+        pass
+
+    if os.path.isfile(os.path.join(common_dir, ref)):
+        return True
+    try:
+        with open(os.path.join(common_dir, "packed-refs"), encoding="utf-8") as f:
+            return any(line.rstrip("\n").endswith(" " + ref) for line in f)
+    except OSError:
+        return False
+
+
+def has_commits():
+    """True if the current repo has at least one commit."""
+    git_dir = get_git_context().git_dir
+    if not git_dir:
+        return False
+    answer = _has_commits_on_disk(git_dir)
+    if answer is not None:
+        return answer
+    # The files didn't say — ask the long-running Git helper instead
+    return get_persistent_git().query("HEAD") is not None
+
+
+def is_git_repo():
+    """Check if the current directory is inside a Git repository."""
+    return get_git_context().inside_tree
+
+
+def get_repo_root():
+    """Find the root directory of the current Git repo, or None."""
+    return get_git_context().toplevel
+
+
+# The one status call every workflow shares. Porcelain v2 is Git's
+# machine-readable format, so we can both classify files and print a
+# friendly summary from a single run. -z ends each entry with a NUL
+# character instead of a newline, so Git hands us file names exactly
+# as they are (no quoting of spaces, accents, etc.).
+# --no-optional-locks stops us from fighting an editor's Git
+# integration over .git/index.lock, and --no-ahead-behind skips
+# comparing against GitHub (we never show it).
+STATUS_CMD = ["git", "--no-optional-locks", "status", "--porcelain=v2", "-z",
+              "--branch", "--untracked-files=normal", "--no-ahead-behind"]
+
+# A parsed 'git status'. Each list holds file paths.
+#   entries:      (code, path) pairs using the two-letter codes from
+#                 'git status --short' (e.g. "??", " M", "A ")
+#   oid:          the commit HEAD points at ("(initial)" before the first)
+#   renamed_from: new path -> old path, for each rename
+StatusSnapshot = namedtuple(
+    "StatusSnapshot",
+    ["branch", "entries", "staged", "modified", "untracked", "conflicted",
+     "oid", "renamed_from"]
+)
+
+
+# How many space-separated fields come before the path on each kind of
+# porcelain v2 line (ordinary change, rename, conflict)
+_STATUS_PATH_FIELD = {"1": 8, "2": 9, "u": 10}
+
+
+def parse_status(porcelain):
+    """
+    Turn 'git status --porcelain=v2 --branch -z' output into a StatusSnapshot.
+    Ordinary entries start with '1', renames with '2', conflicts with 'u',
+    and untracked files with '?'. The two letters after that say what
+    changed in the staging area (X) and in your working folder (Y).
+    """
+    branch = oid = None
+    entries, staged, modified, untracked, conflicted = [], [], [], [], []
+    renamed_from = {}
+
+    records = iter(porcelain.split("\0"))
+    for line in records:
+        kind = line[:1]
+        if line.startswith("# branch.head "):
+            branch = line[len("# branch.head "):]
+        elif line.startswith("# branch.oid "):
+            oid = line[len("# branch.oid "):]
+        elif kind == "?":
+            path = line[2:]
+            entries.append(("??", path))
+            untracked.append(path)
+        elif kind in ("1", "2", "u"):
+            xy = line[2:4]
+            path = line.split(" ", _STATUS_PATH_FIELD[kind])[-1]
+            if kind == "2":
+                # The next record is the name it was renamed from
+                renamed_from[path] = next(records, "")
+            entries.append((xy.replace(".", " "), path))
+            if kind == "u":
+                conflicted.append(path)
+                continue
+            if xy[0] != ".":
+                staged.append(path)
+            if xy[1] != ".":
+                modified.append(path)
+
+    return StatusSnapshot(branch, entries, staged, modified, untracked,
+                          conflicted, oid, renamed_from)
+
+
+# How long (in seconds) a status answer is reused when .git/index and
+# .git/HEAD haven't changed
+_STATUS_TTL = 2.0
+
+
+def get_status():
+    """
+    Run the shared status command once and return a StatusSnapshot.
+    If Git refuses (a broken index, a repo it doesn't trust), show the
+    error the way run_git() would and return None.
+    """
+    def read():
+        # Unlike the background lookups, keep stderr: if Git refuses,
+        # its message is what the user needs to see
+        result = subprocess.run(STATUS_CMD, stdout=subprocess.PIPE,
+                                stderr=subprocess.PIPE)
+        # Raising means the cache never stores a failed read — an empty
+        # answer here would look exactly like "working tree clean"
+        result.check_returncode()
+        return parse_status(result.stdout.decode("utf-8", errors="replace"))
+    # Staging or committing rewrites .git/index or .git/HEAD. Editing a file
+    # doesn't touch either, so a remembered answer is only trusted for a
+    # couple of seconds — long enough to skip a repeat status right after
+    # the last one, too short to miss an edit you just saved.
+    for lock in _git_dir_paths("index.lock"):
+        if os.path.exists(lock):
+            # Another Git command (maybe your editor's) is halfway through
+            # updating the index — don't trust a remembered answer
+            _git_cache.invalidate("status")
+    try:
+        return _git_cache.get("status", read, _git_dir_paths("index", "HEAD"),
+                              ttl=_STATUS_TTL)
+    except subprocess.CalledProcessError as failure:
+        error = failure.stderr.decode("utf-8", errors="replace").strip()
+        show_command_header(["status"])
+        print(f"  ERROR: {error or 'Git could not read the status of this repo.'}")
+        sys.stdout.write(_COMMAND_FOOTER)
+        return None
+
+
+def _paths_from_here(paths):
+    """
+    Porcelain v2 gives paths from the repo's root folder. Show them from
+    the current folder instead, like 'git status --short' does, so a name
+    the user copies from the list works with 'git add' right here.
+    """
+    toplevel = get_git_context().toplevel
+    if not toplevel:
+        return list(paths)
+    here = os.getcwd()
+    shown = []
+    for path in paths:
+        rel = os.path.relpath(os.path.join(toplevel, path), here)
+        rel = rel.replace(os.sep, "/")
+        if path.endswith("/"):
+            rel += "/"  # an untracked folder keeps its slash, e.g. "./"
+        shown.append(rel)
+    return shown
+
+
+def show_status(snapshot, grouped=False):
+    """
+    Print a StatusSnapshot framed like run_git() output.
+    grouped=False uses the short two-letter codes ('git status --short');
+    grouped=True lists files under plain-English headings.
+    """
+    # Show the command the user would type, not STATUS_CMD — its
+    # machine-readable options would be no use to copy into a terminal
+    cmd = "git status" if grouped else "git status --short"
+    print()
+    print(f"  COMMAND RAN: {cmd}")
+    print()
+    print(f"  Below is what you'd see if you typed '{cmd}' in your")
+    print("  terminal, tidied up a little. This is what Git is telling you:")
+    print(SEPARATOR)
+
+    if snapshot.branch == "(detached)":
+        print(f"HEAD detached at {snapshot.oid[:7]}")
+    elif snapshot.branch:
+        print(f"On branch {snapshot.branch}")
+
+    # Renames read "old -> new", like 'git status' shows them
+    every_path = [path for _, path in snapshot.entries]
+    every_path += snapshot.renamed_from.values()
+    shown = dict(zip(every_path, _paths_from_here(every_path)))
+
+    def label(path):
+        if path in snapshot.renamed_from:
+            return f"{shown[snapshot.renamed_from[path]]} -> {shown[path]}"
+        return shown[path]
+
+    if not snapshot.entries:
+        print("nothing to commit, working tree clean")
+    elif not grouped:
+        for code, path in snapshot.entries:
+            print(f"{code} {label(path)}")
+    else:
+        groups = [
+            ("Conflicted (both branches changed these)", snapshot.conflicted),
+            ("Staged (ready to be committed)", snapshot.staged),
+            ("Modified (changed but not staged yet)", snapshot.modified),
+            ("Untracked (new files Git hasn't seen before)", snapshot.untracked),
+        ]
+        for heading, paths in groups:
+            if paths:
+                print()
+                print(f"{heading}:")
+                # A rename is a staged change, so only that list shows it
+                describe = label if paths is snapshot.staged else shown.get
+                for path in paths:
+                    print(f"    {describe(path)}")
+
+    print(SEPARATOR)
+    print()
 
 
 # ============================================================
 # WORKFLOW: Initialize a new repository
 # ============================================================
 
+def _protected_prefixes():
+    """Windows system folders, normalized and ending in a backslash."""
+    roots = [
+        os.environ.get("SystemRoot", r"C:\Windows"),
+        os.environ.get("ProgramFiles", r"C:\Program Files"),
+        os.environ.get("ProgramFiles(x86)", r"C:\Program Files (x86)"),
+    ]
+    # AppData lives inside each user's profile; LOCALAPPDATA points into it
+    local_appdata = os.environ.get("LOCALAPPDATA")
+    if local_appdata:
+        roots.append(ntpath.dirname(local_appdata))
+    return tuple(ntpath.normcase(root).rstrip("\\") + "\\" for root in roots)
+
+
+_PROTECTED_PREFIXES = _protected_prefixes()
+
+
+def is_protected_path(path):
+    """
+    True if `path` is a Windows system folder (or inside one).
+    Matches whole folder names only, so C:\\Windows is caught but
+    C:\\WindowsProjects isn't.
+    """
+    # normcase lowercases and turns / into \ ; the trailing \ lets one
+    # startswith() cover both "is the folder" and "is inside the folder"
+    return (ntpath.normcase(path) + "\\").startswith(_PROTECTED_PREFIXES)
+
+
+# The starter .gitignore offered after 'git init'. Stored as bytes so it's
+# written exactly as-is (Git reads .gitignore fine with plain \n endings).
+_DEFAULT_GITIGNORE = (
+    b"# Python\n"
+    b"__pycache__/\n"
+    b"*.pyc\n"
+    b".env\n"
+    b"venv/\n"
+    b"\n"
+    b"# IDE / Editor\n"
+    b".vscode/\n"
+    b".idea/\n"
+    b"\n"
+    b"# OS files\n"
+    b".DS_Store\n"
+    b"Thumbs.db\n"
+)
+
+
 def workflow_init():
     explain("""--- Initialize a New Repository ---
 
@@ -129,15 +948,13 @@ WHAT THIS DOES:
     path = input("  Press Enter to use the current directory: ").strip()
 
     if not path:
+        # The current folder is already an absolute path
         path = os.getcwd()
-
-    path = os.path.abspath(path)
+    else:
+        path = os.path.abspath(path)
 
     # Guard against system directories that will always fail
-    protected = ["\\windows", "\\system32", "\\program files",
-                 "\\program files (x86)", "\\appdata"]
-    path_lower = path.lower()
-    if any(p in path_lower for p in protected):
+    if is_protected_path(path):
         explain(f"""That path looks like a system folder:
   {path}
 
@@ -148,17 +965,48 @@ WHAT THIS DOES:
   Go back and enter the path to where your actual project files live.""")
         return
 
-    if not os.path.isdir(path):
+    # One directory listing answers "does the folder exist?", "is this
+    # already a repo?" and (later) "is there a .gitignore yet?" — no
+    # separate check for each
+    try:
+        with os.scandir(path) as entries:
+            names = {entry.name for entry in entries}
+    except FileNotFoundError:
         if prompt_yes_no(f"'{path}' doesn't exist. Create it?"):
             os.makedirs(path)
             print(f"  Created: {path}")
+            names = set()
         else:
             print("  Cancelled.")
             return
+    except NotADirectoryError:
+        explain(f"""That path is a file, not a folder:
+  {path}
+
+  Enter the folder that contains your project files instead.""")
+        return
+    except PermissionError:
+        explain(f"""You don't have permission to open that folder:
+  {path}
+
+  Make sure the path points to a folder YOU created — for example:
+    C:\\Users\\YourName\\repos\\my-project
+
+  Try again with the correct path to your project folder.""")
+        return
+    except OSError as failure:
+        # Anything else the system refuses (a disconnected drive, a
+        # broken network folder, ...)
+        explain(f"""Couldn't open that folder:
+  {path}
+
+  Your system said: {failure.strerror or failure}
+
+  Check that the folder is reachable, then try again.""")
+        return
 
     # Check if already a repo
-    git_dir = os.path.join(path, ".git")
-    if os.path.isdir(git_dir):
+    if ".git" in names:
         os.chdir(path)
         explain(f"""This folder is already a Git repo. No need to init again.
   Path: {path}
@@ -167,19 +1015,16 @@ WHAT THIS DOES:
   will work against this repo.""")
         return
 
-    # Run git init in the target directory
-    original_dir = os.getcwd()
-    os.chdir(path)
-    success, _, _ = run_git("init")
-
-    if not success:
-        os.chdir(original_dir)
+    # Run git init in the target directory. We only move there ourselves
+    # once we know init succeeded.
+    success, _, _ = run_git("init", cwd=path)
 
     if success:
-        # Stay in the repo directory so all other options work against it
+        # Move into the repo directory so all other options work against it
+        os.chdir(path)
         # Offer to create a .gitignore so junk files don't get committed
         gitignore_path = os.path.join(path, ".gitignore")
-        if not os.path.exists(gitignore_path):
+        if ".gitignore" not in names:
             explain("""One more thing — a .gitignore file tells Git which files to
 IGNORE (not track). Without one, Git will try to save everything
 in this folder, including junk files like:
@@ -190,23 +1035,21 @@ in this folder, including junk files like:
 These clutter your repo and can even leak sensitive info.""")
 
             if prompt_yes_no("Create a .gitignore with common defaults?"):
-                with open(gitignore_path, "w", encoding="utf-8") as f:
-                    f.write(
-                        "# Python\n"
-                        "__pycache__/\n"
-                        "*.pyc\n"
-                        ".env\n"
-                        "venv/\n"
-                        "\n"
-                        "# IDE / Editor\n"
-                        ".vscode/\n"
-                        ".idea/\n"
-                        "\n"
-                        "# OS files\n"
-                        ".DS_Store\n"
-                        "Thumbs.db\n"
-                    )
-                print(f"  Created: {gitignore_path}")
+                # O_EXCL: create it only if it still doesn't exist, so we
+                # never overwrite one made while the question was on screen.
+                # O_BINARY (Windows only) writes the bytes exactly as-is.
+                flags = (os.O_WRONLY | os.O_CREAT | os.O_EXCL
+                         | getattr(os, "O_BINARY", 0))
+                try:
+                    fd = os.open(gitignore_path, flags, 0o644)
+                except FileExistsError:
+                    print(f"  Skipped: {gitignore_path} already exists.")
+                else:
+                    try:
+                        os.write(fd, _DEFAULT_GITIGNORE)
+                    finally:
+                        os.close(fd)
+                    print(f"  Created: {gitignore_path}")
                 print()
 
         explain(f"""Done! Git is now tracking: {path}
@@ -255,40 +1098,36 @@ WHAT THIS DOES:
     input("  Press Enter to continue...")
     clear_screen()
 
-    if not is_git_repo():
+    ctx = get_git_context()
+    if not ctx.inside_tree:
         explain("You're not inside a Git repository. Use 'Initialize a new repo' first.")
         return
 
-    _, output, _ = run_git("status")
-
-    # Interpret the output for the user
-    if output:
-        porcelain = subprocess.run(
-            ["git", "status", "--porcelain"],
-            capture_output=True, text=True
-        )
-        status_lines = porcelain.stdout.strip()
+    # One status call gives us both the display and the interpretation
+    snapshot = get_status()
+    if snapshot is None:
+        return
+    show_status(snapshot, grouped=True)
 
-        if not status_lines:
-            explain("""WHAT THIS MEANS:
+    if not snapshot.entries:
+        explain("""WHAT THIS MEANS:
   Everything is clean — all your files match your last save point.
   There's nothing new to commit right now.""")
-        else:
-            has_untracked = any(line.startswith("?") for line in status_lines.splitlines())
-            has_modified = any(line[1] == "M" for line in status_lines.splitlines() if len(line) > 1)
-            has_staged = any(line[0] in "MADRC" for line in status_lines.splitlines() if len(line) > 0)
-
-            explain("WHAT THIS MEANS:")
-            if has_untracked:
-                print("  - Files listed as 'Untracked' are new files Git can see but")
-                print("    hasn't saved yet.")
-            if has_modified:
-                print("  - Files listed as 'Modified' have been edited since your last")
-                print("    save point but haven't been staged yet.")
-            if has_staged:
-                print("  - Files listed as 'Staged' are ready to be committed (saved).")
-
-            explain("""WHAT TO DO NEXT:
+    else:
+        meanings = []
+        if snapshot.untracked:
+            meanings.append("- Files listed as 'Untracked' are new files Git can see but\n"
+                            "  hasn't saved yet.")
+        if snapshot.modified:
+            meanings.append("- Files listed as 'Modified' have been edited since your last\n"
+                            "  save point but haven't been staged yet.")
+        if snapshot.staged:
+            meanings.append("- Files listed as 'Staged' are ready to be committed (saved).")
+
+        # One explain() for the whole answer, so it's written in one go
+        explain("WHAT THIS MEANS:\n\n" + "\n".join(meanings) + """
+
+WHAT TO DO NEXT:
   To save these changes, use option 3 (Stage and commit) from the
   main menu. That will lock them into a snapshot on your machine.
   Then use option 4 (Create a README) to build your project's front
@@ -317,7 +1156,8 @@ WHAT THIS DOES:
     input("  Press Enter to continue...")
     clear_screen()
 
-    if not is_git_repo():
+    ctx = get_git_context()
+    if not ctx.inside_tree:
         explain("You're not inside a Git repository. Use 'Initialize a new repo' first.")
         return
 
@@ -330,15 +1170,13 @@ uses shorthand symbols:
   M   = Modified  (a file that changed since your last save)
   A   = Staged    (a file already marked for the next save)""")
 
-    run_git("status", "--short")
-
-    # Check if there's anything to commit
-    result = subprocess.run(
-        ["git", "status", "--porcelain"],
-        capture_output=True, text=True
-    )
+    # The same snapshot drives the display and the "anything to commit?" check
+    snapshot = get_status()
+    if snapshot is None:
+        return
+    show_status(snapshot)
 
-    if not result.stdout.strip():
+    if not snapshot.entries:
         explain("Nothing to commit — your working directory is clean. Make some changes first!")
         return
 
@@ -353,14 +1191,7 @@ right call.""")
     print("  3. Return to main menu")
     print()
 
-    while True:
-        try:
-            choice = int(input("  Pick an option: ").strip())
-            if 1 <= choice <= 3:
-                break
-        except ValueError:
-            pass
-        print("  Please enter 1, 2, or 3.")
+    choice = prompt_choice(3)
 
     if choice == 3:
         print("  Cancelled.")
@@ -370,10 +1201,19 @@ right call.""")
         explain("Staging all changes:")
         run_git("add", ".")
     else:
-        file_path = input("  Enter the file name (or path) to stage: ").strip()
-        if file_path:
-            explain(f"Staging '{file_path}':")
-            run_git("add", file_path)
+        print("  You can list several files separated by spaces. Put quotes")
+        print('  around any name that has a space in it (e.g. "my notes.txt").')
+        raw = input("  Enter the file name(s) to stage: ").strip()
+        try:
+            file_paths = split_paths(raw)
+        except ValueError:
+            print("  Looks like a quote is missing. Cancelled.")
+            return
+        if file_paths:
+            explain(f"Staging {', '.join(repr(f) for f in file_paths)}:")
+            # One 'git add' for every file; '--' means "everything after
+            # this is a file name", even if it starts with a dash
+            run_git("add", "--", *file_paths)
         else:
             print("  No file specified. Cancelled.")
             return
@@ -443,10 +1283,24 @@ WHAT THIS DOES:
     input("  Press Enter to continue...")
     clear_screen()
 
-    if not is_git_repo():
+    ctx = get_git_context()
+    if not ctx.inside_tree:
         explain("You're not inside a Git repository. Use 'Initialize a new repo' first.")
         return
 
+    # Imported here rather than at the top: it drags in the logging module,
+    # and only this workflow needs it
+    from concurrent.futures import ThreadPoolExecutor
+
+    # The remote and branch lookups are independent and read-only, so run
+    # them side by side in the background while the user answers the
+    # account question. The repo context is already cached by now, and
+    # this thread doesn't touch the cache again until it collects them.
+    pool = ThreadPoolExecutor(max_workers=2)
+    remotes_future = pool.submit(get_remotes)
+    branch_future = pool.submit(get_current_branch)
+    pool.shutdown(wait=False)
+
     # Check if user has a GitHub account
     explain("""Before we push, you need a GitHub account. If you already
 have one, skip ahead. If not, let's set one up now.""")
@@ -456,14 +1310,7 @@ have one, skip ahead. If not, let's set one up now.""")
     print("  3. Return to main menu")
     print()
 
-    while True:
-        try:
-            acct_choice = int(input("  Pick an option: ").strip())
-            if 1 <= acct_choice <= 3:
-                break
-        except ValueError:
-            pass
-        print("  Please enter 1, 2, or 3.")
+    acct_choice = prompt_choice(3)
 
     if acct_choice == 3:
         print("  Cancelled.")
@@ -491,13 +1338,12 @@ come back here and press Enter to continue.""")
         input("  Press Enter when your GitHub account is ready...")
         clear_screen()
 
-    # Check if remote exists
-    result = subprocess.run(
-        ["git", "remote", "-v"],
-        capture_output=True, text=True
-    )
+    # Collect both lookups before anything below runs Git (and clears
+    # the cache) on this thread. Then check if a remote exists.
+    remotes = remotes_future.result()
+    branch = branch_future.result() or "main"
 
-    if not result.stdout.strip():
+    if not remotes:
         explain("""--- Push: Step 1 of 2 — CONNECT TO GITHUB ---
 
 Your local repo doesn't know where to upload to yet. You need
@@ -545,18 +1391,11 @@ Linking to GitHub:""")
             return
     else:
         explain("--- Pushing to GitHub ---\n\nRemote is already connected:")
-        print(result.stdout)
+        print(remotes)
         print()
 
-    # Check which branch we're on
-    result = subprocess.run(
-        ["git", "branch", "--show-current"],
-        capture_output=True, text=True
-    )
-    branch = result.stdout.strip() or "main"
-
     explain(f"Uploading your commits to GitHub (branch: {branch}):")
-    success, _, stderr = run_git("push", "-u", "origin", branch)
+    success, _, stderr = run_git_streaming("push", "-u", "origin", branch)
 
     if success:
         explain("""Done! Your code is now live on GitHub.
@@ -650,22 +1489,18 @@ WHAT THIS DOES:
     input("  Press Enter to continue...")
     clear_screen()
 
-    if not is_git_repo():
+    ctx = get_git_context()
+    if not ctx.inside_tree:
         explain("You're not inside a Git repository. Use 'Initialize a new repo' first.")
         return
 
     # Check if there are any commits
-    result = subprocess.run(
-        ["git", "log", "--oneline", "-1"],
-        capture_output=True, text=True
-    )
-
-    if result.returncode != 0:
+    if not has_commits():
         explain("No commits yet. Make your first commit using 'Stage and commit changes.'")
         return
 
     explain("Showing recent commits (last 10):")
-    run_git("log", "--oneline", "--graph", "-10")
+    run_git_streaming("log", "--oneline", "--graph", "-10")
 
 
 # ============================================================
@@ -696,10 +1531,10 @@ WHAT THIS DOES:
 
     if dest:
         explain(f"Cloning into '{dest}':")
-        run_git("clone", url, dest)
+        run_git_streaming("clone", url, dest)
     else:
         explain("Cloning:")
-        run_git("clone", url)
+        run_git_streaming("clone", url)
 
     explain("""If that succeeded, you now have a full copy of the repo.
 Use your terminal to navigate into the new folder to start working with it.""")
@@ -709,17 +1544,6 @@ Use your terminal to navigate into the new folder to start working with it.""")
 # WORKFLOW: Create a README
 # ============================================================
 
-def get_repo_root():
-    """Find the root directory of the current Git repo, or None."""
-    result = subprocess.run(
-        ["git", "rev-parse", "--show-toplevel"],
-        capture_output=True, text=True
-    )
-    if result.returncode == 0:
-        return result.stdout.strip()
-    return None
-
-
 def workflow_readme():
     explain("""--- Create a README ---
 
@@ -739,7 +1563,7 @@ WHAT THIS DOES:
     clear_screen()
 
     # Find the repo root so the README lands in the right place
-    repo_root = get_repo_root()
+    repo_root = get_git_context().toplevel
     if not repo_root:
         explain("""You're not inside a Git repository. Use 'Initialize a new repo'
 first (option 1), then come back here to create your README.""")
@@ -759,14 +1583,7 @@ built using this tool's guided prompts.""")
         print("  3. Return to main menu")
         print()
 
-        while True:
-            try:
-                readme_choice = int(input("  Pick an option: ").strip())
-                if 1 <= readme_choice <= 3:
-                    break
-            except ValueError:
-                pass
-            print("  Please enter 1, 2, or 3.")
+        readme_choice = prompt_choice(3)
 
         if readme_choice == 1:
             explain("""Keeping your existing README. No changes made.
@@ -792,37 +1609,27 @@ to save it, then option 5 (Push to GitHub) to upload it.""")
     status = input("  Status (Active / Complete / In Progress): ").strip()
 
     # Build the README content
-    lines = []
-    lines.append(f"# {project_name or 'Project Name'}")
-
+    # Each optional section, in the order it appears in the README.
+    # Sections you skipped are left out.
+    sections = [
+        ("The Problem", problem),
+        ("The Solution", solution),
+        ("How It Works", how_it_works),
+        ("Results", results),
+        ("Tech Stack", tech),
+        ("Status", status),
+    ]
+
+    lines = [f"# {project_name or 'Project Name'}"]
     if tagline:
         lines.append(f"\n{tagline}")
-
-    if problem:
-        lines.append(f"\n## The Problem\n\n{problem}")
-
-    if solution:
-        lines.append(f"\n## The Solution\n\n{solution}")
-
-    if how_it_works:
-        lines.append(f"\n## How It Works\n\n{how_it_works}")
-
-    if results:
-        lines.append(f"\n## Results\n\n{results}")
-
-    if tech:
-        lines.append(f"\n## Tech Stack\n\n{tech}")
-
-    if status:
-        lines.append(f"\n## Status\n\n{status}")
+    lines += [f"\n## {heading}\n\n{text}" for heading, text in sections if text]
 
     readme_content = "\n".join(lines) + "\n"
 
-    # Preview
-    print("\n  --- README Preview ---\n")
-    for line in readme_content.splitlines():
-        print(f"    {line}")
-    print()
+    # Preview, indented and written in one go like explain() does
+    preview = "".join(f"    {line}\n" for line in readme_content.splitlines())
+    sys.stdout.write(f"\n  --- README Preview ---\n\n{preview}\n")
 
     if prompt_yes_no("Write this to README.md?"):
         file_path = os.path.join(repo_root, "README.md")
@@ -871,16 +1678,13 @@ WHY USE BRANCHES?
     input("  Press Enter to continue...")
     clear_screen()
 
-    if not is_git_repo():
+    ctx = get_git_context()
+    if not ctx.inside_tree:
         explain("You're not inside a Git repository. Use 'Initialize a new repo' first.")
         return
 
     # Check for commits first — can't branch without at least one
-    result = subprocess.run(
-        ["git", "log", "--oneline", "-1"],
-        capture_output=True, text=True
-    )
-    if result.returncode != 0:
+    if not has_commits():
         explain("""You need at least one commit before you can create a branch.
 Go to option 3 (Stage and commit) first, then come back here.""")
         return
@@ -891,14 +1695,7 @@ Go to option 3 (Stage and commit) first, then come back here.""")
     print("  4. Return to main menu")
     print()
 
-    while True:
-        try:
-            choice = int(input("  Pick an option: ").strip())
-            if 1 <= choice <= 4:
-                break
-        except ValueError:
-            pass
-        print("  Please enter 1, 2, 3, or 4.")
+    choice = prompt_choice(4)
 
     if choice == 4:
         print("  Cancelled.")
@@ -1030,28 +1827,21 @@ WHAT COULD GO WRONG?
     input("  Press Enter to continue...")
     clear_screen()
 
-    if not is_git_repo():
+    ctx = get_git_context()
+    if not ctx.inside_tree:
         explain("You're not inside a Git repository. Use 'Initialize a new repo' first.")
         return
 
     # Show current branch
-    result = subprocess.run(
-        ["git", "branch", "--show-current"],
-        capture_output=True, text=True
-    )
-    current_branch = result.stdout.strip()
+    current_branch = get_current_branch()
 
     explain(f"""You are currently on branch: {current_branch}
 
 Here are all your branches:""")
-    run_git("branch")
-
-    # Check if there's more than one branch
-    all_branches = subprocess.run(
-        ["git", "branch"],
-        capture_output=True, text=True
-    )
-    branch_list = [b.strip().lstrip("* ") for b in all_branches.stdout.strip().splitlines()]
+    # The list we just showed is also the list we pick from — no need to
+    # run 'git branch' a second time behind the scenes
+    _, branches_output, _ = run_git("branch")
+    branch_list = parse_branch_list(branches_output)
 
     if len(branch_list) < 2:
         explain("""You only have one branch. There's nothing to merge.
@@ -1096,14 +1886,7 @@ This will bring all the changes from that branch into this one.""")
         print(f"  {i}. {b}")
     print()
 
-    while True:
-        try:
-            choice = int(input("  Pick a branch to merge (number): ").strip())
-            if 1 <= choice <= len(other_branches):
-                break
-        except ValueError:
-            pass
-        print(f"  Please enter a number between 1 and {len(other_branches)}.")
+    choice = prompt_choice(len(other_branches), "Pick a branch to merge (number)")
 
     merge_branch = other_branches[choice - 1]
 
@@ -1168,9 +1951,15 @@ WHAT GIT DID:
 
 LET'S SEE WHICH FILES HAVE CONFLICTS:""")
 
-    run_git("status", "--short")
+    snapshot = get_status()
+    if snapshot is None:
+        return
+    show_status(snapshot)
 
-    explain("""Files marked with 'UU' or 'AA' have conflicts that need fixing.
+    explain("""Files marked 'AA', 'DD', or with a 'U' in their code ('UU', 'AU',
+'UA', 'DU', 'UD') have conflicts that need fixing. ('DU' and 'UD'
+mean one branch deleted a file the other changed — there are no
+markers to remove, just decide whether to keep the file.)
 
 HOW TO FIX IT:
   1. Open each conflicted file in your text editor
@@ -1203,23 +1992,20 @@ IMPORTANT: Make sure you've:
 
 Let's check the status:""")
 
-    run_git("status", "--short")
-
-    # Check if there are still unmerged files
-    result = subprocess.run(
-        ["git", "status", "--porcelain"],
-        capture_output=True, text=True
-    )
-    has_conflicts = any(
-        line.startswith("UU") or line.startswith("AA")
-        for line in result.stdout.strip().splitlines()
-    )
+    # The files were just edited in another program, so read status fresh.
+    # The same snapshot drives the display and the "still conflicted?" check.
+    _git_cache.invalidate("status")
+    snapshot = get_status()
+    if snapshot is None:
+        return
+    show_status(snapshot)
 
-    if has_conflicts:
+    if snapshot.conflicted:
         explain("""It looks like there are still unresolved conflicts.
 
-Open the files marked with 'UU' in your editor and make sure
-you've removed ALL the conflict markers (<<<, ===, >>>).
+Open the conflicted files listed above (marked 'AA', 'DD', or
+with a 'U' in their code) in your editor and make sure you've
+removed ALL the conflict markers (<<<, ===, >>>).
 
 When you're done, come back and try the merge again.""")
         return
@@ -1311,45 +2097,84 @@ MENU_OPTIONS = [
 ]
 
 
-def show_welcome():
+def _build_menu_frame():
+    """The whole main menu as one string (MENU_OPTIONS never changes)."""
+    lines = [
+        "",
+        "  ╔══════════════════════════════════╗",
+        "  ║         GIT ONBOARD              ║",
+        "  ║   Your Git learning companion    ║",
+        "  ╚══════════════════════════════════╝",
+        "",
+        "  ── WHAT DO I DO? ─────────────────────────────────────────",
+        "  The options below are listed in the order you'd typically",
+        "  use them. If this is your first time, start with #1 and",
+        "  work your way down as you go.",
+        "",
+        "  ── OPTIONS ───────────────────────────────────────────────",
+        "",
+    ]
+    for i, (label, description, _) in enumerate(MENU_OPTIONS, 1):
+        marker = " ← start here" if i == 1 else ""
+        lines += [f"  {i}. {label}{marker}", f"     {description}", ""]
+    lines += [f"  {len(MENU_OPTIONS) + 1}. Exit", "", ""]
+    return "\n".join(lines)
+
+
+# Built once at startup and written in a single go on every redraw
+MENU_FRAME = _build_menu_frame()
+
+# The function behind each option, in menu order, for dispatching a choice
+_MENU_ACTIONS = tuple(action for _, _, action in MENU_OPTIONS)
+
+
+# The welcome screen never changes, so it's one block of text written in
+# a single go rather than ~40 separate print() calls
+WELCOME_TEXT = """
+  ╔══════════════════════════════════╗
+  ║       WELCOME TO GIT ONBOARD     ║
+  ╚══════════════════════════════════╝
+
+  Before we start, let's cover the basics.
+
+  ── WHAT IS GIT? ──────────────────────────────────────────────
+
+  Git is a version control system. Think of it as an unlimited
+  'undo history' for your entire project. Every time you save a
+  snapshot (called a 'commit'), Git remembers exactly what every
+  file looked like at that moment.
+
+  You can go back to any snapshot, see what changed between
+  them, and never worry about losing your work again.
+
+  ── WHAT IS GITHUB? ───────────────────────────────────────────
+
+  GitHub is a website that stores your Git snapshots online.
+  It's where developers share code, collaborate, and build
+  portfolios that show off their work to employers.
+
+  Git is the tool on your computer. GitHub is the cloud backup.
+  You use Git locally, then 'push' your work up to GitHub
+  when you're ready to share it.
+
+  ── WHAT DOES THIS TOOL DO? ───────────────────────────────────
+
+  Git Onboard walks you through Git step by step. Before every
+  action, it explains what's about to happen and why. After
+  every action, it shows you the real Git command that ran.
+
+  The goal: you learn Git by using it, not by memorizing
+  commands. Eventually, you won't need this tool at all.
+
+"""
+
+
+def show_welcome(git_version=None):
     """First-launch welcome screen. Explains Git, GitHub, and this tool."""
     clear_screen()
-    print()
-    print("  ╔══════════════════════════════════╗")
-    print("  ║       WELCOME TO GIT ONBOARD     ║")
-    print("  ╚══════════════════════════════════╝")
-    print()
-    print("  Before we start, let's cover the basics.")
-    print()
-    print("  ── WHAT IS GIT? ──────────────────────────────────────────────")
-    print()
-    print("  Git is a version control system. Think of it as an unlimited")
-    print("  'undo history' for your entire project. Every time you save a")
-    print("  snapshot (called a 'commit'), Git remembers exactly what every")
-    print("  file looked like at that moment.")
-    print()
-    print("  You can go back to any snapshot, see what changed between")
-    print("  them, and never worry about losing your work again.")
-    print()
-    print("  ── WHAT IS GITHUB? ───────────────────────────────────────────")
-    print()
-    print("  GitHub is a website that stores your Git snapshots online.")
-    print("  It's where developers share code, collaborate, and build")
-    print("  portfolios that show off their work to employers.")
-    print()
-    print("  Git is the tool on your computer. GitHub is the cloud backup.")
-    print("  You use Git locally, then 'push' your work up to GitHub")
-    print("  when you're ready to share it.")
-    print()
-    print("  ── WHAT DOES THIS TOOL DO? ───────────────────────────────────")
-    print()
-    print("  Git Onboard walks you through Git step by step. Before every")
-    print("  action, it explains what's about to happen and why. After")
-    print("  every action, it shows you the real Git command that ran.")
-    print()
-    print("  The goal: you learn Git by using it, not by memorizing")
-    print("  commands. Eventually, you won't need this tool at all.")
-    print()
+    if git_version:
+        sys.stdout.write(f"\n  Git detected: {git_version}\n")
+    sys.stdout.write(WELCOME_TEXT)
     input("  Press Enter to continue...")
 
 
@@ -1357,48 +2182,25 @@ def main_menu():
     """Display the main menu and handle user input."""
     while True:
         clear_screen()
-        print()
-        print("  ╔══════════════════════════════════╗")
-        print("  ║         GIT ONBOARD              ║")
-        print("  ║   Your Git learning companion    ║")
-        print("  ╚══════════════════════════════════╝")
-        print()
-        print("  ── WHAT DO I DO? ─────────────────────────────────────────")
-        print("  The options below are listed in the order you'd typically")
-        print("  use them. If this is your first time, start with #1 and")
-        print("  work your way down as you go.")
-        print()
-        print("  ── OPTIONS ───────────────────────────────────────────────")
-        print()
-
-        for i, (label, description, _) in enumerate(MENU_OPTIONS, 1):
-            marker = " ← start here" if i == 1 else ""
-            print(f"  {i}. {label}{marker}")
-            print(f"     {description}")
-            print()
-
-        exit_num = len(MENU_OPTIONS) + 1
-        print(f"  {exit_num}. Exit")
-        print()
+        sys.stdout.write(MENU_FRAME)
+        sys.stdout.flush()
 
+        exit_num = len(_MENU_ACTIONS) + 1
         try:
-            choice = int(input("  Pick an option: ").strip())
-        except (ValueError, EOFError):
-            print("  Please enter a number.")
-            continue
+            choice = prompt_choice(exit_num)
+        except EOFError:
+            # Input was closed (Ctrl+D / Ctrl+Z) — nothing more to read
+            choice = exit_num
 
         if choice == exit_num:
             print("\n  See you next time. Keep committing.\n")
             break
 
-        if 1 <= choice <= len(MENU_OPTIONS):
-            clear_screen()
-            try:
-                MENU_OPTIONS[choice - 1][2]()
-            except KeyboardInterrupt:
-                print("\n  Interrupted. Returning to menu.")
-        else:
-            print(f"  Please enter a number between 1 and {exit_num}.")
+        clear_screen()
+        try:
+            _MENU_ACTIONS[choice - 1]()
+        except KeyboardInterrupt:
+            print("\n  Interrupted. Returning to menu.")
 
         input("\n  Press Enter to return to the menu...")
 
@@ -1413,12 +2215,14 @@ def check_git_installed():
     and wait for them to complete it before continuing.
     Returns True once Git is detected.
     """
-    try:
-        result = subprocess.run(["git", "--version"], capture_output=True, text=True)
-        if result.returncode == 0:
-            return True
-    except FileNotFoundError:
-        pass  # Git executable doesn't exist at all — fall through to install guide
+    # Imported here rather than at the top: nothing else needs shutil, and
+    # it pulls in several modules of its own
+    import shutil
+
+    # Looking for git on the PATH is instant; running 'git --version' just
+    # to see whether it starts is one of the slowest things we do at launch
+    if shutil.which("git"):
+        return True
 
     # Git not found — walk the user through installation
     clear_screen()
@@ -1476,25 +2280,52 @@ def check_git_installed():
     sys.exit(0)
 
 
+# Answers that can't change while the program runs, remembered after the
+# first time we ask
+_git_version = None
+_git_identity = None
+
+
+def read_git_version():
+    """The installed Git's version, e.g. 'git version 2.44.0'."""
+    global _git_version
+    if _git_version is None:
+        result = subprocess.run(["git", "--version"], stdout=subprocess.PIPE,
+                                stderr=subprocess.DEVNULL, text=True)
+        _git_version = result.stdout.strip()
+    return _git_version
+
+
+def read_git_identity():
+    """
+    Your global (user.name, user.email) — '' for any that isn't set.
+    One 'git config --get-regexp' call reads both.
+    """
+    result = subprocess.run(
+        ["git", "config", "--global", "--get-regexp", r"^user\.(name|email)$"],
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+    )
+    found = {}
+    for line in result.stdout.splitlines():
+        key, _, value = line.partition(" ")
+        found[key] = value.strip()
+    return found.get("user.name", ""), found.get("user.email", "")
+
+
 def check_git_config():
     """
     Check if git user.name and user.email are configured.
     If not, walk the user through setting them up.
     These are required before making any commits.
     """
-    name_result = subprocess.run(
-        ["git", "config", "--global", "user.name"],
-        capture_output=True, text=True
-    )
-    email_result = subprocess.run(
-        ["git", "config", "--global", "user.email"],
-        capture_output=True, text=True
-    )
+    global _git_identity
+    if _git_identity is not None:
+        return  # Already checked (and set up, if needed) this session
 
-    name = name_result.stdout.strip()
-    email = email_result.stdout.strip()
+    name, email = read_git_identity()
 
     if name and email:
+        _git_identity = (name, email)
         return  # Already configured
 
     clear_screen()
@@ -1530,6 +2361,8 @@ def check_git_config():
         print(f"  Set: user.email = {email}")
         print()
 
+    _git_identity = (name, email)
+
     explain(f"""You're all set! Git will tag your commits as:
   {name} <{email}>
 
@@ -1551,13 +2384,20 @@ if __name__ == "__main__":
         # Step 1: Make sure Git is installed
         check_git_installed()
 
+        # The version is only shown on the welcome screen, so look it up in
+        # the background while the identity check runs
+        version = []
+        version_reader = threading.Thread(
+            target=lambda: version.append(read_git_version()), daemon=True
+        )
+        version_reader.start()
+
         # Step 2: Make sure Git identity is configured
-        result = subprocess.run(["git", "--version"], capture_output=True, text=True)
-        print(f"\n  Git detected: {result.stdout.strip()}")
         check_git_config()
 
         # Step 3: Welcome and main menu
-        show_welcome()
+        version_reader.join()
+        show_welcome(version[0] if version else None)
         main_menu()
     except Exception as e:
         print()